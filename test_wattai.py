@@ -0,0 +1,221 @@
+import importlib.util
+
+import numpy as np
+import pytest
+
+import wattai
+from wattai import (
+    calculate_cloud_cost,
+    calculate_local_cost,
+    cheapest_option,
+    sweep_costs,
+    GPUNotFoundError,
+    InvalidInputError,
+)
+
+
+HAS_JAX = importlib.util.find_spec("jax") is not None
+
+
+@pytest.fixture(params=[
+    "numpy",
+    pytest.param("jax", marks=pytest.mark.skipif(not HAS_JAX, reason="JAX not installed")),
+])
+def backend(request, monkeypatch):
+    """Run sweep_costs on the given backend."""
+    if request.param == "numpy":
+        monkeypatch.setattr(wattai, "_jax", False)
+    else:
+        monkeypatch.setattr(wattai, "_jax", None)
+        monkeypatch.setattr(wattai, "_sweep_kernel", None)
+    return request.param
+
+
+def test_sweep_costs_matches_calculate_cloud_cost(backend):
+    electricity_costs = [0.0, 0.1, 0.35]
+    hours = [0.0, 1.0, 10.0, 24.5]
+
+    cloud_costs, local_costs = sweep_costs(electricity_costs, hours)
+
+    assert cloud_costs.shape == (len(hours), len(electricity_costs), len(wattai.GPU_DATABASE))
+    assert local_costs.shape == cloud_costs.shape
+    for i, h in enumerate(hours):
+        for j, ec in enumerate(electricity_costs):
+            for k, gpu_name in enumerate(wattai.GPU_DATABASE):
+                expected = calculate_cloud_cost(ec, gpu_name, h)
+                assert cloud_costs[i, j, k] == pytest.approx(expected.total_cost_usd)
+                assert local_costs[i, j, k] == pytest.approx(expected.energy_cost_usd)
+
+
+def test_sweep_costs_returns_writable_arrays(backend):
+    cloud_costs, local_costs = sweep_costs([0.1], [1.0])
+
+    assert cloud_costs.flags.writeable
+    assert local_costs.flags.writeable
+
+
+def test_sweep_costs_accepts_scalars(backend):
+    cloud_costs, local_costs = sweep_costs(0.1, 2.0, ["A100"])
+
+    assert cloud_costs.shape == (1, 1, 1)
+    assert local_costs.shape == (1, 1, 1)
+    assert cloud_costs[0, 0, 0] == pytest.approx(calculate_cloud_cost(0.1, "A100", 2.0).total_cost_usd)
+
+
+@pytest.mark.parametrize("electricity_costs, hours", [
+    ([-0.1], [1.0]),
+    ([0.1], [-1.0]),
+    ([[0.1]], [1.0]),
+])
+def test_sweep_costs_rejects_invalid_input(backend, electricity_costs, hours):
+    with pytest.raises(InvalidInputError):
+        sweep_costs(electricity_costs, hours)
+
+
+def test_sweep_costs_rejects_unknown_gpu(backend):
+    with pytest.raises(GPUNotFoundError):
+        sweep_costs([0.1], [1.0], ["Not A GPU"])
+
+
+@pytest.mark.skipif(not HAS_JAX, reason="JAX not installed")
+def test_sweep_costs_backends_agree(monkeypatch):
+    electricity_costs = np.linspace(0.0, 0.5, 7)
+    hours = np.linspace(0.0, 48.0, 5)
+
+    monkeypatch.setattr(wattai, "_jax", False)
+    numpy_results = sweep_costs(electricity_costs, hours)
+    monkeypatch.setattr(wattai, "_jax", None)
+    monkeypatch.setattr(wattai, "_sweep_kernel", None)
+    jax_results = sweep_costs(electricity_costs, hours)
+
+    for numpy_costs, jax_costs in zip(numpy_results, jax_results):
+        assert numpy_costs.shape == jax_costs.shape
+        np.testing.assert_allclose(jax_costs, numpy_costs, rtol=1e-12)
+
+
+@pytest.fixture
+def gpu_tables(monkeypatch):
+    """Restore the GPU database and its derived tables after the test."""
+    database = dict(wattai.GPU_DATABASE)
+    coeffs = dict(wattai._GPU_COEFFS)
+    index = dict(wattai._INDEX)
+    monkeypatch.setattr(wattai, "_NAMES", wattai._NAMES)
+    monkeypatch.setattr(wattai, "_NAMES_TEXT", wattai._NAMES_TEXT)
+    monkeypatch.setattr(wattai, "_WATTS", wattai._WATTS.copy())
+    monkeypatch.setattr(wattai, "_HOURLY", wattai._HOURLY.copy())
+    monkeypatch.setattr(wattai, "_DB_VERSION", wattai._DB_VERSION)
+    yield
+    for table, saved in ((wattai.GPU_DATABASE, database), (wattai._GPU_COEFFS, coeffs), (wattai._INDEX, index)):
+        table.clear()
+        table.update(saved)
+
+
+def test_register_gpu_adds_new_gpu(gpu_tables):
+    version = wattai.get_db_version()
+
+    wattai.register_gpu("H100", 700, 4.00)
+
+    assert wattai.get_gpu_names()[-1] == "H100"
+    with pytest.raises(GPUNotFoundError, match="'H100'\\]"):
+        calculate_cloud_cost(0.1, "Not A GPU", 2.0)
+    assert wattai.get_db_version() > version
+    expected = calculate_cloud_cost(0.1, "H100", 2.0)
+    assert expected.energy_kwh == pytest.approx(1.4)
+    assert expected.total_cost_usd == pytest.approx(0.14 + 8.00)
+    cloud_costs, local_costs = sweep_costs([0.1], [2.0], ["H100"])
+    assert cloud_costs[0, 0, 0] == pytest.approx(expected.total_cost_usd)
+    assert local_costs[0, 0, 0] == pytest.approx(expected.energy_cost_usd)
+
+
+def test_register_gpu_updates_existing_gpu(gpu_tables):
+    names = wattai.get_gpu_names()
+    version = wattai.get_db_version()
+
+    wattai.register_gpu("A100", 300, 2.50)
+
+    assert wattai.get_gpu_names() == names
+    assert wattai.get_db_version() > version
+    expected = calculate_cloud_cost(0.1, "A100", 2.0)
+    assert expected.energy_kwh == pytest.approx(0.6)
+    assert expected.total_cost_usd == pytest.approx(0.06 + 5.00)
+    cloud_costs, local_costs = sweep_costs([0.1], [2.0], ["A100"])
+    assert cloud_costs[0, 0, 0] == pytest.approx(expected.total_cost_usd)
+    assert local_costs[0, 0, 0] == pytest.approx(expected.energy_cost_usd)
+
+
+@pytest.mark.parametrize("watts, hourly_cost_usd", [
+    (-1.0, 1.0),
+    (float("nan"), 1.0),
+    (float("inf"), 1.0),
+    (100.0, -1.0),
+    (100.0, float("nan")),
+    (100.0, float("inf")),
+])
+def test_register_gpu_rejects_invalid_specs(gpu_tables, watts, hourly_cost_usd):
+    with pytest.raises(InvalidInputError):
+        wattai.register_gpu("Broken", watts, hourly_cost_usd)
+
+    assert "Broken" not in wattai.get_gpu_names()
+
+
+def reference_cheapest_option(electricity_cost_usd, hours):
+    """Check every GPU in database order, cloud before local."""
+    cheapest = None
+    for gpu_name in wattai.get_gpu_names():
+        cloud_price = calculate_cloud_cost(electricity_cost_usd, gpu_name, hours).total_cost_usd
+        if cheapest is None or cloud_price < cheapest[2]:
+            cheapest = (gpu_name, False, cloud_price)
+        local_price = calculate_local_cost(electricity_cost_usd, gpu_name, hours).total_cost_usd
+        if local_price < cheapest[2]:
+            cheapest = (gpu_name, True, local_price)
+    return cheapest
+
+
+@pytest.mark.parametrize("electricity_cost_usd, hours", [
+    (0.1, 0.0),
+    (0.0, 10.0),
+    (0.0, 0.0),
+    (0.1, 1.0),
+    (0.35, 24.5),
+])
+def test_cheapest_option_matches_reference(electricity_cost_usd, hours):
+    assert cheapest_option(electricity_cost_usd, hours) == reference_cheapest_option(electricity_cost_usd, hours)
+
+
+@pytest.mark.parametrize("electricity_cost_usd, hours", [(0.1, 10.0), (0.0, 10.0), (0.1, 0.0)])
+def test_cheapest_option_prefers_cloud_without_compute_fees(gpu_tables, electricity_cost_usd, hours):
+    wattai.register_gpu("Free Cloud", 100, 0.0)
+
+    result = cheapest_option(electricity_cost_usd, hours)
+
+    assert result == reference_cheapest_option(electricity_cost_usd, hours)
+    if electricity_cost_usd * hours > 0:
+        assert result[:2] == ("Free Cloud", False)
+
+
+def test_cheapest_option_picks_first_gpu_with_equal_wattage(gpu_tables):
+    wattai.register_gpu("Low Power A", 100, 1.00)
+    wattai.register_gpu("Low Power B", 100, 0.50)
+
+    result = cheapest_option(0.1, 10.0)
+
+    assert result == reference_cheapest_option(0.1, 10.0)
+    assert result[:2] == ("Low Power A", True)
+
+
+def test_cheapest_option_sees_registered_gpu(gpu_tables):
+    before = cheapest_option(0.1, 10.0)
+
+    wattai.register_gpu("Low Power", 100, 1.00)
+
+    result = cheapest_option(0.1, 10.0)
+    assert result == reference_cheapest_option(0.1, 10.0)
+    assert result[:2] == ("Low Power", True)
+    assert result[2] < before[2]
+
+
+def test_cheapest_option_rejects_invalid_input():
+    with pytest.raises(InvalidInputError):
+        cheapest_option(-0.1, 1.0)
+    with pytest.raises(InvalidInputError):
+        cheapest_option(0.1, -1.0)
@@ -3,7 +3,10 @@ WattAI Core Engine
 This file contains pure calculation logic.
 No UI code. No Streamlit code.
 """
-from typing import Dict, Any
+import math
+from typing import Dict, Any, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 # Constants
@@ -11,12 +14,34 @@ DEFAULT_ELECTRICITY_COST_USD = 0.10
 WATTS_TO_KWH_CONVERSION = 1000.0
 
 # GPU Database
+# Add or update GPUs with register_gpu so the derived tables below stay in
+# sync. GPUs added here directly are picked up the first time they are
+# looked up by name.
 GPU_DATABASE: Dict[str, Dict[str, float]] = {
     "RTX 3090": {"watts": 350, "hourly_cost_usd": 1.80},
     "A100": {"watts": 400, "hourly_cost_usd": 3.50},
     "RTX 4090": {"watts": 450, "hourly_cost_usd": 2.20},
 }
 
+# Per-GPU cost coefficients: (kWh per hour, hourly cost in USD)
+_GPU_COEFFS: Dict[str, Tuple[float, float]] = {
+    name: (gpu["watts"] / WATTS_TO_KWH_CONVERSION, gpu["hourly_cost_usd"])
+    for name, gpu in GPU_DATABASE.items()
+}
+
+# Structure-of-arrays view of GPU_DATABASE for vectorized searches.
+# _INDEX maps a GPU name to its position in _NAMES, _WATTS and _HOURLY.
+_NAMES: Tuple[str, ...] = tuple(GPU_DATABASE)
+_INDEX: Dict[str, int] = {name: i for i, name in enumerate(_NAMES)}
+_WATTS = np.array([gpu["watts"] for gpu in GPU_DATABASE.values()], dtype=np.float64)
+_HOURLY = np.array([gpu["hourly_cost_usd"] for gpu in GPU_DATABASE.values()], dtype=np.float64)
+
+# GPU names as shown in GPUNotFoundError messages; rebuilt when _NAMES grows
+_NAMES_TEXT = str(list(_NAMES))
+
+# Bumped on every change to GPU_DATABASE; lets callers key caches on it
+_DB_VERSION = 0
+
 
 class GPUNotFoundError(Exception):
     """Raised when a GPU name is not found in the database."""
@@ -28,6 +53,21 @@ class InvalidInputError(Exception):
     pass
 
 
+class CloudCost(NamedTuple):
+    """Cost breakdown for running a GPU in the cloud."""
+    energy_kwh: float
+    energy_cost_usd: float
+    compute_cost_usd: float
+    total_cost_usd: float
+
+
+class LocalCost(NamedTuple):
+    """Cost breakdown for running a GPU locally."""
+    energy_kwh: float
+    energy_cost_usd: float
+    total_cost_usd: float
+
+
 def validate_inputs(electricity_cost_usd: float, hours: float) -> None:
     """
     Validate input parameters for cost calculations.
@@ -45,11 +85,90 @@ def validate_inputs(electricity_cost_usd: float, hours: float) -> None:
         raise InvalidInputError("Hours cannot be negative")
 
 
+def get_gpu_names() -> Tuple[str, ...]:
+    """
+    Return the names of all GPUs in the database, in database order.
+    
+    The tuple is rebuilt only when register_gpu adds a GPU, so this is
+    cheap to call on every rerun of the UI.
+    
+    Returns:
+        Tuple of GPU names
+    """
+    return _NAMES
+
+
+def get_db_version() -> int:
+    """
+    Return the current GPU database version.
+    
+    The version changes whenever the database is modified through
+    register_gpu, so it can be used as part of a cache key.
+    
+    Returns:
+        Current database version
+    """
+    return _DB_VERSION
+
+
+def register_gpu(gpu_name: str, watts: float, hourly_cost_usd: float) -> None:
+    """
+    Add a GPU to GPU_DATABASE, or update an existing entry.
+    
+    This is the supported way to change GPU_DATABASE: it keeps the
+    precomputed cost tables and the database version in sync. Editing an
+    existing entry in GPU_DATABASE directly is not picked up.
+    
+    Args:
+        gpu_name: Name of the GPU
+        watts: Power draw of the GPU in watts
+        hourly_cost_usd: Cloud provider fee per hour in USD
+        
+    Raises:
+        InvalidInputError: If watts or hourly_cost_usd is negative or not finite
+    """
+    global _NAMES, _NAMES_TEXT, _WATTS, _HOURLY, _DB_VERSION
+
+    if not math.isfinite(watts) or watts < 0:
+        raise InvalidInputError("GPU watts must be a finite, non-negative number")
+    if not math.isfinite(hourly_cost_usd) or hourly_cost_usd < 0:
+        raise InvalidInputError("Hourly cost must be a finite, non-negative number")
+
+    GPU_DATABASE[gpu_name] = {"watts": watts, "hourly_cost_usd": hourly_cost_usd}
+    _GPU_COEFFS[gpu_name] = (watts / WATTS_TO_KWH_CONVERSION, hourly_cost_usd)
+
+    idx = _INDEX.get(gpu_name)
+    if idx is None:
+        idx = len(_NAMES)
+        _INDEX[gpu_name] = idx
+        _NAMES += (gpu_name,)
+        _NAMES_TEXT = str(list(_NAMES))
+        _WATTS = np.resize(_WATTS, idx + 1)
+        _HOURLY = np.resize(_HOURLY, idx + 1)
+    _WATTS[idx] = watts
+    _HOURLY[idx] = hourly_cost_usd
+
+    _DB_VERSION += 1
+
+
+def _adopt_gpu(gpu_name: str) -> None:
+    """
+    Register a GPU that was added to GPU_DATABASE directly.
+    
+    Raises:
+        GPUNotFoundError: If gpu_name is not in GPU_DATABASE
+    """
+    gpu = GPU_DATABASE.get(gpu_name)
+    if gpu is None:
+        raise GPUNotFoundError(f"GPU '{gpu_name}' not found in database. Available GPUs: {_NAMES_TEXT}")
+    register_gpu(gpu_name, gpu["watts"], gpu["hourly_cost_usd"])
+
+
 def calculate_cloud_cost(
     electricity_cost_usd: float, 
     gpu_name: str, 
     hours: float
-) -> Dict[str, float]:
+) -> CloudCost:
     """
     Calculate the total cost of running a GPU in the cloud.
     
@@ -61,7 +180,7 @@ def calculate_cloud_cost(
         hours: Number of hours of usage
         
     Returns:
-        Dictionary containing:
+        CloudCost containing:
             - energy_kwh: Energy consumption in kWh
             - energy_cost_usd: Cost of energy in USD
             - compute_cost_usd: Cost of compute (cloud provider fees) in USD
@@ -71,34 +190,34 @@ def calculate_cloud_cost(
         GPUNotFoundError: If gpu_name is not in GPU_DATABASE
         InvalidInputError: If input values are invalid
     """
-    validate_inputs(electricity_cost_usd, hours)
+    # Single check on the common path; validate_inputs picks the message
+    if electricity_cost_usd < 0 or hours < 0:
+        validate_inputs(electricity_cost_usd, hours)
     
-    if gpu_name not in GPU_DATABASE:
-        raise GPUNotFoundError(f"GPU '{gpu_name}' not found in database. Available GPUs: {list(GPU_DATABASE.keys())}")
+    if gpu_name not in _GPU_COEFFS:
+        _adopt_gpu(gpu_name)
     
-    gpu = GPU_DATABASE[gpu_name]
-    gpu_watts = gpu["watts"]
-    gpu_hourly_cost = gpu["hourly_cost_usd"]
+    kwh_per_hour, hourly_cost = _GPU_COEFFS[gpu_name]
 
-    energy_kwh = (gpu_watts * hours) / WATTS_TO_KWH_CONVERSION
+    energy_kwh = kwh_per_hour * hours
     energy_cost = energy_kwh * electricity_cost_usd
-    compute_cost = gpu_hourly_cost * hours
+    compute_cost = hourly_cost * hours
 
     total_cost = energy_cost + compute_cost
 
-    return {
-        "energy_kwh": energy_kwh,
-        "energy_cost_usd": energy_cost,
-        "compute_cost_usd": compute_cost,
-        "total_cost_usd": total_cost,
-    }
+    return CloudCost(
+        energy_kwh=energy_kwh,
+        energy_cost_usd=energy_cost,
+        compute_cost_usd=compute_cost,
+        total_cost_usd=total_cost,
+    )
 
 
 def calculate_local_cost(
     electricity_cost_usd: float, 
     gpu_name: str, 
     hours: float
-) -> Dict[str, float]:
+) -> LocalCost:
     """
     Calculate the total cost of running a GPU locally.
     
@@ -110,7 +229,7 @@ def calculate_local_cost(
         hours: Number of hours of usage
         
     Returns:
-        Dictionary containing:
+        LocalCost containing:
             - energy_kwh: Energy consumption in kWh
             - energy_cost_usd: Cost of energy in USD
             - total_cost_usd: Total cost (energy only) in USD
@@ -119,22 +238,172 @@ def calculate_local_cost(
         GPUNotFoundError: If gpu_name is not in GPU_DATABASE
         InvalidInputError: If input values are invalid
     """
-    validate_inputs(electricity_cost_usd, hours)
+    # Single check on the common path; validate_inputs picks the message
+    if electricity_cost_usd < 0 or hours < 0:
+        validate_inputs(electricity_cost_usd, hours)
     
-    if gpu_name not in GPU_DATABASE:
-        raise GPUNotFoundError(f"GPU '{gpu_name}' not found in database. Available GPUs: {list(GPU_DATABASE.keys())}")
+    if gpu_name not in _GPU_COEFFS:
+        _adopt_gpu(gpu_name)
     
-    gpu = GPU_DATABASE[gpu_name]
-    gpu_watts = gpu["watts"]
+    kwh_per_hour, _ = _GPU_COEFFS[gpu_name]
 
-    energy_kwh = (gpu_watts * hours) / WATTS_TO_KWH_CONVERSION
+    energy_kwh = kwh_per_hour * hours
     energy_cost = energy_kwh * electricity_cost_usd
 
-    return {
-        "energy_kwh": energy_kwh,
-        "energy_cost_usd": energy_cost,
-        "total_cost_usd": energy_cost,
-    }
+    return LocalCost(
+        energy_kwh=energy_kwh,
+        energy_cost_usd=energy_cost,
+        total_cost_usd=energy_cost,
+    )
+
+
+def _totals(
+    electricity_cost_usd: float, 
+    gpu_name: str, 
+    hours: float
+) -> Tuple[float, float]:
+    """
+    Return (cloud_total, local_total) for one GPU without building a result.
+    
+    Inputs are not validated; only for trusted callers.
+    """
+    kwh_per_hour, hourly_cost = _GPU_COEFFS[gpu_name]
+    energy_cost = kwh_per_hour * hours * electricity_cost_usd
+    return energy_cost + hourly_cost * hours, energy_cost
+
+
+def cheapest_option(
+    electricity_cost_usd: float, 
+    hours: float
+) -> Optional[Tuple[str, bool, float]]:
+    """
+    Find the cheapest GPU option (cloud or local) across GPU_DATABASE.
+    
+    Args:
+        electricity_cost_usd: Cost of electricity per kWh
+        hours: Number of hours of usage
+        
+    Returns:
+        Tuple of (gpu_name, is_local, total_cost_usd) or None if database is empty
+        
+    Raises:
+        InvalidInputError: If input values are invalid
+    """
+    validate_inputs(electricity_cost_usd, hours)
+    
+    if not _NAMES:
+        return None
+
+    # Local cost is the energy cost alone and cloud cost adds compute fees,
+    # which register_gpu keeps non-negative, so for every GPU local <= cloud.
+    # The cheapest option is therefore the cheapest local one: the
+    # lowest-wattage GPU, or the first GPU when energy is free.
+    if hours * electricity_cost_usd > 0:
+        gpu_name = _NAMES[int(_WATTS.argmin())]
+    else:
+        gpu_name = _NAMES[0]
+    cloud_price, local_price = _totals(electricity_cost_usd, gpu_name, hours)
+
+    # Without compute fees the cloud option costs the same; it comes first
+    # in database order, so it wins the tie.
+    if cloud_price == local_price:
+        return (gpu_name, False, cloud_price)
+    return (gpu_name, True, local_price)
+
+
+def _sweep_point(watts, hourly, electricity_cost_usd, hours):
+    """Cloud and local totals for every GPU at one (electricity cost, hours) point."""
+    energy_cost = watts * (hours * electricity_cost_usd / WATTS_TO_KWH_CONVERSION)
+    return energy_cost + hourly * hours, energy_cost
+
+
+# JAX is optional and slow to import, so it is loaded on the first
+# sweep_costs call. _jax is the module, or False once it is known to be missing.
+_jax: Any = None
+_sweep_kernel: Any = None
+
+
+def _load_sweep_kernel() -> Any:
+    """
+    Import JAX and build the sweep kernel on first use.
+    
+    Returns:
+        The jitted kernel, or None if JAX is not installed
+    """
+    global _jax, _sweep_kernel
+
+    if _jax is None:
+        try:
+            import jax
+        except ImportError:  # JAX is optional; fall back to NumPy broadcasting
+            _jax = False
+            return None
+
+        # Map over electricity costs, then over hours: output is (hours, costs, gpus)
+        _sweep_kernel = jax.jit(
+            jax.vmap(
+                jax.vmap(_sweep_point, in_axes=(None, None, 0, None)),
+                in_axes=(None, None, None, 0),
+            )
+        )
+        _jax = jax
+
+    return _sweep_kernel if _jax else None
+
+
+def sweep_costs(
+    electricity_costs_usd: Sequence[float],
+    hours: Sequence[float],
+    gpu_names: Optional[Sequence[str]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate cloud and local total costs over a grid of parameters.
+    
+    Uses a JAX-compiled kernel when JAX is installed, NumPy otherwise.
+    
+    Args:
+        electricity_costs_usd: Electricity costs per kWh to evaluate
+            (a scalar counts as a single value)
+        hours: Numbers of hours of usage to evaluate (a scalar counts as
+            a single value)
+        gpu_names: GPUs to evaluate (defaults to every GPU in GPU_DATABASE)
+        
+    Returns:
+        Tuple of (cloud_costs, local_costs) arrays, each of shape
+        (len(hours), len(electricity_costs_usd), len(gpu_names))
+        
+    Raises:
+        GPUNotFoundError: If a name in gpu_names is not in GPU_DATABASE
+        InvalidInputError: If input values are invalid
+    """
+    electricity_costs = np.atleast_1d(np.asarray(electricity_costs_usd, dtype=np.float64))
+    hours_array = np.atleast_1d(np.asarray(hours, dtype=np.float64))
+    if electricity_costs.ndim != 1 or hours_array.ndim != 1:
+        raise InvalidInputError("Electricity costs and hours must be scalars or 1-D sequences")
+    if (electricity_costs < 0).any():
+        raise InvalidInputError("Electricity cost cannot be negative")
+    if (hours_array < 0).any():
+        raise InvalidInputError("Hours cannot be negative")
+
+    if gpu_names is None:
+        watts, hourly = _WATTS, _HOURLY
+    else:
+        for gpu_name in gpu_names:
+            if gpu_name not in _INDEX:
+                _adopt_gpu(gpu_name)
+        indices = [_INDEX[name] for name in gpu_names]
+        watts, hourly = _WATTS[indices], _HOURLY[indices]
+
+    kernel = _load_sweep_kernel()
+    if kernel is not None:
+        with _jax.enable_x64(True):
+            cloud_costs, local_costs = kernel(watts, hourly, electricity_costs, hours_array)
+        # np.array copies, so callers get writable arrays as on the NumPy path
+        return np.array(cloud_costs), np.array(local_costs)
+
+    return _sweep_point(
+        watts, hourly, electricity_costs[None, :, None], hours_array[:, None, None]
+    )
 
 
 # Optional: simple test mode
@@ -144,5 +413,5 @@ if __name__ == "__main__":
     result_cloud = calculate_cloud_cost(DEFAULT_ELECTRICITY_COST_USD, "RTX 3090", 10)
     result_local = calculate_local_cost(DEFAULT_ELECTRICITY_COST_USD, "RTX 3090", 10)
 
-    print("Cloud Total Cost:", round(result_cloud["total_cost_usd"], 2))
-    print("Local Total Cost:", round(result_local["total_cost_usd"], 2))
\ No newline at end of file
+    print("Cloud Total Cost:", round(result_cloud.total_cost_usd, 2))
+    print("Local Total Cost:", round(result_local.total_cost_usd, 2))
\ No newline at end of file
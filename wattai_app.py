@@ -2,18 +2,21 @@ import streamlit as st
 from typing import Dict, Optional, Tuple
 from wattai import (
     calculate_cloud_cost, 
-    calculate_local_cost, 
+    LocalCost,
+    cheapest_option,
+    get_db_version,
+    get_gpu_names,
     GPU_DATABASE,
     DEFAULT_ELECTRICITY_COST_USD,
     GPUNotFoundError,
     InvalidInputError
 )
+from wattai_ui import COST_DECIMAL_PLACES, format_currency
 
 # Constants
 BENCHMARK_ELECTRICITY_COST = DEFAULT_ELECTRICITY_COST_USD
 BENCHMARK_HOURS = 1.0
 DEFAULT_HOURS = 10.0
-COST_DECIMAL_PLACES = 2
 PREVIEW_COST_DECIMAL_PLACES = 4
 
 st.set_page_config(page_title="WattAI", layout="centered")
@@ -22,24 +25,11 @@ st.title("⚡ WattAI")
 st.subheader("AI Cost Intelligence Calculator")
 
 
-def format_currency(amount: float, decimal_places: int = COST_DECIMAL_PLACES) -> str:
-    """
-    Format a currency amount with specified decimal places.
-    
-    Args:
-        amount: The amount to format
-        decimal_places: Number of decimal places
-        
-    Returns:
-        Formatted currency string
-    """
-    return f"${round(amount, decimal_places):.{decimal_places}f}"
-
-
 @st.cache_data
 def find_cheapest_option(
     electricity_cost: float, 
-    hours: float
+    hours: float,
+    db_version: int
 ) -> Optional[Tuple[str, float]]:
     """
     Find the cheapest GPU option (cloud or local) for given parameters.
@@ -47,39 +37,22 @@ def find_cheapest_option(
     Args:
         electricity_cost: Cost of electricity per kWh
         hours: Number of hours of usage
+        db_version: Current GPU database version, from get_db_version().
+            Only used as part of the cache key, so cached results are
+            dropped when the database changes.
         
     Returns:
         Tuple of (label, price) or None if database is empty
     """
-    if not GPU_DATABASE:
+    result = cheapest_option(electricity_cost, hours)
+    if result is None:
         return None
     
-    cheapest_price: Optional[float] = None
-    cheapest_label: str = ""
-    
-    for gpu_name in GPU_DATABASE:
-        try:
-            cloud = calculate_cloud_cost(electricity_cost, gpu_name, hours)
-            local = calculate_local_cost(electricity_cost, gpu_name, hours)
-            
-            # Compare cloud option
-            cloud_price = cloud["total_cost_usd"]
-            if cheapest_price is None or cloud_price < cheapest_price:
-                cheapest_price = cloud_price
-                cheapest_label = f"☁️ Cloud - {gpu_name}"
-            
-            # Compare local option
-            local_price = local["total_cost_usd"]
-            if local_price < cheapest_price:
-                cheapest_price = local_price
-                cheapest_label = f"🖥 Local - {gpu_name}"
-                
-        except (GPUNotFoundError, InvalidInputError) as e:
-            st.error(f"Error calculating costs for {gpu_name}: {str(e)}")
-            continue
-    
-    if cheapest_price is None:
-        return None
+    gpu_name, is_local, cheapest_price = result
+    if is_local:
+        cheapest_label = f"🖥 Local - {gpu_name}"
+    else:
+        cheapest_label = f"☁️ Cloud - {gpu_name}"
     
     return (cheapest_label, cheapest_price)
 
@@ -88,14 +61,22 @@ def find_cheapest_option(
 # 🔥 Cheapest Option Preview
 # ---------------------------------
 
-st.markdown("## 🔥 Lowest AI Cost Right Now (1 Hour Benchmark)")
+# The benchmark inputs are constant, so the preview only changes when the
+# GPU database does. Build its text once, up front; find_cheapest_option is
+# cached on the database version, so reruns and other sessions reuse it.
+_PREVIEW = find_cheapest_option(
+    BENCHMARK_ELECTRICITY_COST, BENCHMARK_HOURS, get_db_version()
+)
+_PREVIEW_TEXT = (
+    f"🏆 Cheapest Option: {_PREVIEW[0]}\n\n"
+    f"Cost per hour: {format_currency(_PREVIEW[1], PREVIEW_COST_DECIMAL_PLACES)}"
+    if _PREVIEW else None
+)
 
-cheapest_result = find_cheapest_option(BENCHMARK_ELECTRICITY_COST, BENCHMARK_HOURS)
+st.markdown("## 🔥 Lowest AI Cost Right Now (1 Hour Benchmark)")
 
-if cheapest_result:
-    cheapest_label, cheapest_price = cheapest_result
-    st.success(f"🏆 Cheapest Option: {cheapest_label}")
-    st.write(f"Cost per hour: {format_currency(cheapest_price, PREVIEW_COST_DECIMAL_PLACES)}")
+if _PREVIEW_TEXT:
+    st.success(_PREVIEW_TEXT)
 else:
     st.warning("⚠️ No GPUs available in database. Please add GPUs to calculate costs.")
 
@@ -119,7 +100,7 @@ if not GPU_DATABASE:
 
 gpu_name = st.selectbox(
     "Select GPU",
-    options=list(GPU_DATABASE.keys()),
+    options=get_gpu_names(),
     help="Choose the GPU you want to compare costs for"
 )
 
@@ -150,37 +131,45 @@ if st.button("Calculate", type="primary"):
             st.warning("⚠️ Hours is 0. No costs will be incurred.")
             st.stop()
         
-        # Calculate costs
+        # Calculate costs. The local run uses the same energy as the cloud
+        # run, without the compute fees, so derive it instead of recomputing.
         cloud = calculate_cloud_cost(electricity_cost, gpu_name, hours)
-        local = calculate_local_cost(electricity_cost, gpu_name, hours)
+        local = LocalCost(
+            energy_kwh=cloud.energy_kwh,
+            energy_cost_usd=cloud.energy_cost_usd,
+            total_cost_usd=cloud.energy_cost_usd,
+        )
+        cloud_total = cloud.total_cost_usd
+        local_total = local.total_cost_usd
 
         st.markdown("## 📊 Comparison Results")
 
         col1, col2 = st.columns(2)
 
         with col1:
-            st.markdown("### ☁️ Cloud")
-            st.write(f"Energy Cost: {format_currency(cloud['energy_cost_usd'])}")
-            st.write(f"Compute Cost: {format_currency(cloud['compute_cost_usd'])}")
-            st.write(f"**Total: {format_currency(cloud['total_cost_usd'])}**")
+            st.markdown(
+                "### ☁️ Cloud\n\n"
+                f"Energy Cost: ${cloud.energy_cost_usd:.{COST_DECIMAL_PLACES}f}\n\n"
+                f"Compute Cost: ${cloud.compute_cost_usd:.{COST_DECIMAL_PLACES}f}\n\n"
+                f"**Total: ${cloud_total:.{COST_DECIMAL_PLACES}f}**"
+            )
             
             # Additional info
             with st.expander("📈 Details"):
-                st.write(f"Energy Consumption: {cloud['energy_kwh']:.4f} kWh")
+                st.markdown(f"Energy Consumption: {cloud.energy_kwh:.4f} kWh")
 
         with col2:
-            st.markdown("### 🖥 Local")
-            st.write(f"Energy Cost: {format_currency(local['energy_cost_usd'])}")
-            st.write(f"**Total: {format_currency(local['total_cost_usd'])}**")
+            st.markdown(
+                "### 🖥 Local\n\n"
+                f"Energy Cost: ${local.energy_cost_usd:.{COST_DECIMAL_PLACES}f}\n\n"
+                f"**Total: ${local_total:.{COST_DECIMAL_PLACES}f}**"
+            )
             
             # Additional info
             with st.expander("📈 Details"):
-                st.write(f"Energy Consumption: {local['energy_kwh']:.4f} kWh")
+                st.markdown(f"Energy Consumption: {local.energy_kwh:.4f} kWh")
 
         # Comparison result
-        cloud_total = cloud["total_cost_usd"]
-        local_total = local["total_cost_usd"]
-        
         if cloud_total < local_total:
             savings = local_total - cloud_total
             st.success(f"☁️ **Cloud is cheaper** for this workload. Save {format_currency(savings)} by using cloud.")
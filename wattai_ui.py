@@ -0,0 +1,29 @@
+"""
+WattAI UI Helpers
+Presentation helpers for the Streamlit app.
+Kept out of wattai_app.py, which Streamlit re-executes on every rerun,
+so caches here persist across reruns.
+"""
+import functools
+
+
+# Constants
+COST_DECIMAL_PLACES = 2
+
+
+@functools.lru_cache(maxsize=256)
+def format_currency(amount: float, decimal_places: int = COST_DECIMAL_PLACES) -> str:
+    """
+    Format a currency amount with specified decimal places.
+    
+    Results are memoized, since the same few amounts are formatted on every
+    rerun of the UI.
+    
+    Args:
+        amount: The amount to format
+        decimal_places: Number of decimal places
+        
+    Returns:
+        Formatted currency string
+    """
+    return f"${amount:.{decimal_places}f}"